@@ -15,7 +15,7 @@ from src.ui import (
     render_step4_sdk_config,
     render_step5_preview_download,
 )
-from src.generators import TemplateEngine, bundle_to_zip, assemble_client_class, format_code
+from src.generators import TemplateEngine, assemble_client_class, format_code, hash_file_structure
 from src.models import APISpecification
 
 # Page configuration
@@ -85,8 +85,8 @@ if 'sdk_config' not in st.session_state:
 if 'file_structure' not in st.session_state:
     st.session_state.file_structure = None
 
-if 'zip_bytes' not in st.session_state:
-    st.session_state.zip_bytes = None
+if 'file_structure_hash' not in st.session_state:
+    st.session_state.file_structure_hash = None
 
 if 'documentation_analysis' not in st.session_state:
     st.session_state.documentation_analysis = None
@@ -150,12 +150,11 @@ def main():
     
     # Step 1: Input Selection
     if st.session_state.current_step == 1:
-        has_input, documentation_text, input_source = render_step1_input_selection()
-        
         # Update session state if new input is provided
-        if has_input:
-            st.session_state.documentation_text = documentation_text
-            st.session_state.input_source = input_source
+        if render_step1_input_selection():
+            step1_result = st.session_state['step1_result']
+            st.session_state.documentation_text = step1_result['text']
+            st.session_state.input_source = step1_result['source']
         
         # Show Next button if we have documentation (either new or from session)
         if st.session_state.documentation_text:
@@ -232,33 +231,38 @@ def main():
                                 st.error(f"❌ Error: {str(e)}")
         else:
             # Display analysis results
-            should_proceed, action = render_documentation_analysis(
-                st.session_state.documentation_analysis
-            )
+            render_documentation_analysis(st.session_state.documentation_analysis)
             
-            if should_proceed:
-                if action == "continue":
-                    # Proceed to LLM configuration (or skip if provider already set)
-                    if st.session_state.llm_provider:
-                        st.session_state.current_step = 2
-                    else:
-                        st.session_state.current_step = 2
-                    st.rerun()
-                elif action == "add_more":
-                    # Go back to input selection
-                    st.session_state.documentation_analysis = None
-                    st.session_state.current_step = 1
-                    st.rerun()
-                elif action == "retry":
-                    # Clear analysis and retry
-                    st.session_state.documentation_analysis = None
-                    st.rerun()
+            # The analysis fragment records the chosen action in session state
+            action = st.session_state.pop("analysis_action", None)
+            
+            if action == "continue":
+                # Proceed to LLM configuration (or skip if provider already set)
+                if st.session_state.llm_provider:
+                    st.session_state.current_step = 2
+                else:
+                    st.session_state.current_step = 2
+                st.rerun()
+            elif action == "add_more":
+                # Go back to input selection
+                st.session_state.documentation_analysis = None
+                st.session_state.current_step = 1
+                st.rerun()
+            elif action == "retry":
+                # Clear analysis and retry
+                st.session_state.documentation_analysis = None
+                st.rerun()
     
     # Step 2: LLM Configuration
     elif st.session_state.current_step == 2:
         st.info(f"📄 **Input Source:** {st.session_state.input_source}")
         
-        is_configured, llm_provider, config = render_step2_llm_config()
+        render_step2_llm_config()
+        
+        # The config fragment records its result in session state
+        llm_config = st.session_state.get("llm_config", {})
+        is_configured = llm_config.get("is_configured", False)
+        llm_provider = llm_config.get("provider_instance")
         
         if is_configured:
             st.session_state.llm_provider = llm_provider
@@ -378,11 +382,10 @@ def main():
                                 "README.md": readme_code,
                             }
                             
-                            # Bundle to ZIP
-                            zip_bytes = bundle_to_zip(file_structure, st.session_state.api_spec.api_name)
-                            
+                            # The ZIP is bundled (and cached) by the preview step,
+                            # keyed on a digest computed once here
                             st.session_state.file_structure = file_structure
-                            st.session_state.zip_bytes = zip_bytes
+                            st.session_state.file_structure_hash = hash_file_structure(file_structure)
                             st.session_state.current_step = 5
                             st.rerun()
                             
@@ -393,7 +396,7 @@ def main():
     elif st.session_state.current_step == 5:
         render_step5_preview_download(
             st.session_state.file_structure,
-            st.session_state.zip_bytes,
+            st.session_state.file_structure_hash,
             st.session_state.api_spec.api_name
         )
 
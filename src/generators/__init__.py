@@ -9,6 +9,7 @@ from .assembler import (
     bundle_to_zip,
     get_file_tree_display,
     calculate_total_size,
+    hash_file_structure,
     format_size,
 )
 from .validator import (
@@ -31,6 +32,7 @@ __all__ = [
     "bundle_to_zip",
     "get_file_tree_display",
     "calculate_total_size",
+    "hash_file_structure",
     "format_size",
     # Validator
     "validate_typescript_syntax",
@@ -1,5 +1,6 @@
 """Code assembly logic for combining templates and LLM-generated code."""
 
+import hashlib
 import io
 import zipfile
 from typing import Dict
@@ -163,6 +164,25 @@ def calculate_total_size(file_structure: Dict[str, str]) -> int:
     return sum(len(content.encode('utf-8')) for content in file_structure.values())
 
 
+def hash_file_structure(file_structure: Dict[str, str]) -> str:
+    """
+    Get a short digest of a file structure, for use as a cache key.
+    
+    Args:
+        file_structure: Dictionary mapping file paths to content
+        
+    Returns:
+        Hex digest of the file paths and contents
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for file_path, content in file_structure.items():
+        digest.update(file_path.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(content.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
 def format_size(size_bytes: int) -> str:
     """
     Format size in human-readable format.
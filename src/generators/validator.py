@@ -4,6 +4,48 @@ import re
 from typing import List, Tuple
 
 
+# Comments and single-line string literals, whose brackets are not code.
+# Matched left to right in one pass, so "//" inside a string (e.g. a URL)
+# stays part of the string
+_NON_CODE_RE = re.compile(
+    r'"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*'"
+    r'|/\*.*?\*/'
+    r'|//[^\n]*',
+    re.DOTALL
+)
+
+# Import statements, capturing the module specifier
+_IMPORT_RE = re.compile(r'import\s+.*?\s+from\s+[\'"](.+?)[\'"]')
+
+# Dangerous code patterns and their warnings
+_DANGEROUS_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), message)
+    for pattern, message in (
+        (r'\beval\s*\(', "Use of eval() detected - potential security risk"),
+        (r'\bFunction\s*\(', "Use of Function() constructor detected - potential security risk"),
+        (r'\.innerHTML\s*=', "Direct innerHTML assignment detected - potential XSS risk"),
+        (r'document\.write\s*\(', "Use of document.write() detected - not recommended"),
+        (r'dangerouslySetInnerHTML', "Use of dangerouslySetInnerHTML detected"),
+        (r'__proto__', "Direct __proto__ manipulation detected"),
+    )
+)
+
+# Hardcoded secret patterns (basic check) and their warnings
+_SECRET_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), message)
+    for pattern, message in (
+        (r'api[_-]?key\s*[:=]\s*["\'][\w-]{20,}["\']', "Potential hardcoded API key detected"),
+        (r'password\s*[:=]\s*["\'].+["\']', "Potential hardcoded password detected"),
+        (r'secret\s*[:=]\s*["\'].+["\']', "Potential hardcoded secret detected"),
+        (r'token\s*[:=]\s*["\'][\w-]{20,}["\']', "Potential hardcoded token detected"),
+    )
+)
+
+# Explicit 'any' type annotations
+_ANY_TYPE_RE = re.compile(r':\s*any\b')
+
+
 def validate_typescript_syntax(code: str) -> List[str]:
     """
     Perform basic TypeScript syntax validation using regex patterns.
@@ -16,6 +58,9 @@ def validate_typescript_syntax(code: str) -> List[str]:
     """
     errors = []
     
+    # Only count brackets in code, not in comments or string literals
+    code = _NON_CODE_RE.sub('', code)
+    
     # Check for unclosed braces
     open_braces = code.count('{')
     close_braces = code.count('}')
@@ -50,8 +95,7 @@ def check_imports(code: str) -> List[str]:
     issues = []
     
     # Extract import statements
-    import_pattern = r'import\s+.*?\s+from\s+[\'"](.+?)[\'"]'
-    imports = re.findall(import_pattern, code)
+    imports = _IMPORT_RE.findall(code)
     
     # Check for relative imports that might be broken
     for imp in imports:
@@ -77,29 +121,13 @@ def scan_for_security_issues(code: str) -> List[str]:
     warnings = []
     
     # Dangerous patterns
-    dangerous_patterns = [
-        (r'\beval\s*\(', "Use of eval() detected - potential security risk"),
-        (r'\bFunction\s*\(', "Use of Function() constructor detected - potential security risk"),
-        (r'\.innerHTML\s*=', "Direct innerHTML assignment detected - potential XSS risk"),
-        (r'document\.write\s*\(', "Use of document.write() detected - not recommended"),
-        (r'dangerouslySetInnerHTML', "Use of dangerouslySetInnerHTML detected"),
-        (r'__proto__', "Direct __proto__ manipulation detected"),
-    ]
-    
-    for pattern, message in dangerous_patterns:
-        if re.search(pattern, code, re.IGNORECASE):
+    for pattern, message in _DANGEROUS_PATTERNS:
+        if pattern.search(code):
             warnings.append(message)
     
     # Check for hardcoded secrets (basic check)
-    secret_patterns = [
-        (r'api[_-]?key\s*[:=]\s*["\'][\w-]{20,}["\']', "Potential hardcoded API key detected"),
-        (r'password\s*[:=]\s*["\'].+["\']', "Potential hardcoded password detected"),
-        (r'secret\s*[:=]\s*["\'].+["\']', "Potential hardcoded secret detected"),
-        (r'token\s*[:=]\s*["\'][\w-]{20,}["\']', "Potential hardcoded token detected"),
-    ]
-    
-    for pattern, message in secret_patterns:
-        if re.search(pattern, code, re.IGNORECASE):
+    for pattern, message in _SECRET_PATTERNS:
+        if pattern.search(code):
             warnings.append(message)
     
     return warnings
@@ -118,12 +146,7 @@ def validate_no_any_type(code: str) -> List[str]:
     warnings = []
     
     # Find 'any' type usage
-    any_pattern = r':\s*any\b'
-    matches = re.finditer(any_pattern, code)
-    
-    count = 0
-    for match in matches:
-        count += 1
+    count = sum(1 for _ in _ANY_TYPE_RE.finditer(code))
     
     if count > 0:
         warnings.append(f"Found {count} uses of 'any' type - consider using specific types")
@@ -1,8 +1,6 @@
 """LLM integration package."""
 
 from .base_provider import BaseLLMProvider
-from .openai_provider import OpenAIProvider
-from .gemini_provider import GeminiProvider
 from .confidence import (
     calculate_endpoint_confidence,
     calculate_api_confidence,
@@ -10,6 +8,21 @@ from .confidence import (
     get_confidence_color,
 )
 
+# Provider modules pull in heavy SDKs (openai, google-genai), so they are only
+# imported when first accessed
+_LAZY_PROVIDERS = {
+    "OpenAIProvider": ".openai_provider",
+    "GeminiProvider": ".gemini_provider",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_PROVIDERS:
+        import importlib
+        module = importlib.import_module(_LAZY_PROVIDERS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "BaseLLMProvider",
     "OpenAIProvider",
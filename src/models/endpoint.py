@@ -9,6 +9,10 @@ from .parameter import Parameter
 from .schema import Schema
 
 
+# Matches path parameters such as {id} or {user_id}
+_PATH_PARAM_RE = re.compile(r'\{(\w+)\}')
+
+
 class HTTPMethod(str, Enum):
     """Supported HTTP methods."""
     GET = "GET"
@@ -50,27 +54,30 @@ class Endpoint(BaseModel):
         """Validate that path parameters match the path string."""
         path = info.data.get('path', '')
         
-        # Extract path parameters from the path (e.g., {id}, {user_id})
-        path_param_names = set(re.findall(r'\{(\w+)\}', path))
+        # Extract path parameters from the path (e.g., {id}, {user_id}),
+        # skipping the regex for the many paths that have none
+        path_param_names = set(_PATH_PARAM_RE.findall(path)) if '{' in path else set()
         
         # Get path parameters from the parameters list
         declared_path_params = {
             p.name for p in v if p.location.value == 'path'
         }
         
-        # Check for missing path parameters
-        missing = path_param_names - declared_path_params
-        if missing:
-            raise ValueError(
-                f"Path parameters {missing} are in the path but not declared in parameters"
-            )
-        
-        # Check for extra path parameters
-        extra = declared_path_params - path_param_names
-        if extra:
-            raise ValueError(
-                f"Path parameters {extra} are declared but not in the path"
-            )
+        # Only work out the direction of a mismatch when there is one
+        if path_param_names != declared_path_params:
+            # Check for missing path parameters
+            missing = path_param_names - declared_path_params
+            if missing:
+                raise ValueError(
+                    f"Path parameters {missing} are in the path but not declared in parameters"
+                )
+            
+            # Check for extra path parameters
+            extra = declared_path_params - path_param_names
+            if extra:
+                raise ValueError(
+                    f"Path parameters {extra} are declared but not in the path"
+                )
         
         return v
     
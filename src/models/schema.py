@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, Optional
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator
 
 
 class SchemaType(str, Enum):
@@ -31,21 +31,14 @@ class Schema(BaseModel):
         description="Example value for this schema"
     )
     
-    @field_validator('properties')
-    @classmethod
-    def validate_properties(cls, v: Optional[Dict[str, Any]], info) -> Optional[Dict[str, Any]]:
-        """Validate that properties is only set for object types."""
-        if v is not None and info.data.get('type') != SchemaType.OBJECT:
+    @model_validator(mode='after')
+    def validate_type_consistency(self) -> 'Schema':
+        """Validate that properties/items are only set for object/array types."""
+        if self.properties is not None and self.type != SchemaType.OBJECT:
             raise ValueError("Properties can only be set for object type schemas")
-        return v
-    
-    @field_validator('items')
-    @classmethod
-    def validate_items(cls, v: Optional['Schema'], info) -> Optional['Schema']:
-        """Validate that items is only set for array types."""
-        if v is not None and info.data.get('type') != SchemaType.ARRAY:
+        if self.items is not None and self.type != SchemaType.ARRAY:
             raise ValueError("Items can only be set for array type schemas")
-        return v
+        return self
     
     model_config = {
         "json_schema_extra": {
@@ -64,5 +57,7 @@ class Schema(BaseModel):
     }
 
 
-# Enable forward references for recursive Schema
-Schema.model_rebuild()
+# Enable forward references for recursive Schema. Pydantic usually resolves the
+# self-reference when the class is created, so only rebuild if it could not.
+if not Schema.__pydantic_complete__:
+    Schema.model_rebuild()
@@ -1,10 +1,14 @@
 """SDK Configuration model."""
 
-from typing import List, Optional
+from typing import Optional, Tuple
 from enum import Enum
 from pydantic import BaseModel, Field
 
 
+# HTTP status codes retried by default (timeouts, rate limits, server errors)
+_DEFAULT_RETRYABLE_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
+
 class License(str, Enum):
     """Supported license types."""
     MIT = "MIT"
@@ -19,8 +23,8 @@ class RetryConfig(BaseModel):
     max_retries: int = Field(default=3, ge=1, le=10, description="Maximum number of retries")
     base_delay: float = Field(default=1.0, ge=0.5, le=5.0, description="Base delay in seconds")
     max_delay: float = Field(default=30.0, ge=5.0, le=60.0, description="Maximum delay in seconds")
-    retryable_status_codes: List[int] = Field(
-        default=[408, 429, 500, 502, 503, 504],
+    retryable_status_codes: Tuple[int, ...] = Field(
+        default=_DEFAULT_RETRYABLE_STATUS_CODES,
         description="HTTP status codes to retry on"
     )
 
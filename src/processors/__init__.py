@@ -3,6 +3,7 @@
 from .url_fetcher import (
     validate_url,
     fetch_url,
+    fetch_urls,
     extract_text_from_html,
     get_preview,
     get_character_count,
@@ -31,6 +32,7 @@ __all__ = [
     # URL Fetcher
     "validate_url",
     "fetch_url",
+    "fetch_urls",
     "extract_text_from_html",
     "get_preview",
     "get_character_count",
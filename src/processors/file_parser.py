@@ -1,10 +1,66 @@
 """File parsing for uploaded documentation files."""
 
+import re
+import threading
+from functools import lru_cache
 from typing import Tuple, Optional
 from io import BytesIO
 import PyPDF2
 from bs4 import BeautifulSoup
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # Fall back to the pure-Python PyPDF2 extractor
+    pdfium = None
+
+
+# PDFium is not thread-safe, even across separate documents, so all calls
+# into it are serialized
+_PDFIUM_LOCK = threading.Lock()
+
+# Runs of two or more whitespace characters, or a single non-space one
+_WHITESPACE_RUN_RE = re.compile(r'\s{2,}|[^\S ]')
+
+# Characters str.splitlines() treats as line boundaries
+_LINE_BREAK_CHARS = frozenset('\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029')
+
+
+def _collapse_whitespace_run(match: re.Match) -> str:
+    """Turn a whitespace run into a newline if it separates text chunks."""
+    run = match.group()
+    if '  ' in run or not _LINE_BREAK_CHARS.isdisjoint(run):
+        return '\n'
+    return run
+
+
+# Display names for the file types returned by _detect_file_type
+_FILE_TYPE_LABELS = {
+    "pdf": "PDF",
+    "html": "HTML",
+    "text": "Text/Markdown",
+}
+
+
+@lru_cache(maxsize=256)
+def _detect_file_type(filename: str) -> str:
+    """
+    Detect the file type from a filename's extension.
+    
+    Args:
+        filename: Original filename
+        
+    Returns:
+        One of "pdf", "html", "text" or "unknown"
+    """
+    ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if ext == 'pdf':
+        return 'pdf'
+    if ext in ('html', 'htm'):
+        return 'html'
+    if ext in ('txt', 'md', 'markdown'):
+        return 'text'
+    return 'unknown'
+
 
 def validate_file_size(file_bytes: bytes, max_mb: int = 5) -> Tuple[bool, str]:
     """
@@ -33,6 +89,9 @@ def parse_pdf(file_bytes: bytes) -> Tuple[bool, str, str]:
     Returns:
         Tuple of (success, extracted_text, status_message)
     """
+    if pdfium is not None:
+        return _parse_pdf_pdfium(file_bytes)
+    
     try:
         pdf_file = BytesIO(file_bytes)
         pdf_reader = PyPDF2.PdfReader(pdf_file)
@@ -64,6 +123,54 @@ def parse_pdf(file_bytes: bytes) -> Tuple[bool, str, str]:
         return False, "", f"Error parsing PDF: {str(e)}"
 
 
+def _parse_pdf_pdfium(file_bytes: bytes) -> Tuple[bool, str, str]:
+    """Extract text from a PDF file using PDFium (much faster than PyPDF2)."""
+    # The extraction runs in its own frame so every PDFium object it creates
+    # is released before the lock is
+    with _PDFIUM_LOCK:
+        return _extract_pdf_text_pdfium(file_bytes)
+
+
+def _extract_pdf_text_pdfium(file_bytes: bytes) -> Tuple[bool, str, str]:
+    """Extract text with PDFium; callers must hold _PDFIUM_LOCK."""
+    try:
+        pdf = pdfium.PdfDocument(file_bytes)
+    except pdfium.PdfiumError:
+        return False, "", "Invalid or corrupted PDF file"
+    except Exception as e:
+        return False, "", f"Error parsing PDF: {str(e)}"
+    
+    try:
+        page_count = len(pdf)
+        
+        # Check if PDF has pages
+        if page_count == 0:
+            return False, "", "PDF file is empty (no pages found)"
+        
+        # Extract text from all pages
+        text_parts = []
+        for page_num, page in enumerate(pdf):
+            try:
+                # PDFium ends lines with \r\n; match PyPDF2's \n
+                text = page.get_textpage().get_text_range().replace('\r\n', '\n')
+                if text:
+                    text_parts.append(text)
+            except Exception as e:
+                # Continue with other pages if one fails
+                print(f"Warning: Failed to extract text from page {page_num + 1}: {e}")
+        
+        if not text_parts:
+            return False, "", "No text could be extracted from PDF. It may be a scanned image."
+        
+        full_text = "\n\n".join(text_parts)
+        return True, full_text, f"Successfully extracted text from {page_count} pages"
+        
+    except Exception as e:
+        return False, "", f"Error parsing PDF: {str(e)}"
+    finally:
+        pdf.close()
+
+
 def parse_html(file_bytes: bytes) -> Tuple[bool, str, str]:
     """
     Parse HTML file and extract text.
@@ -90,10 +197,9 @@ def parse_html(file_bytes: bytes) -> Tuple[bool, str, str]:
         # Get text
         text = soup.get_text()
         
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = '\n'.join(chunk for chunk in chunks if chunk)
+        # Clean up whitespace: line breaks and double spaces separate chunks,
+        # which end up one per line with surrounding whitespace removed
+        text = _WHITESPACE_RUN_RE.sub(_collapse_whitespace_run, text).strip()
         
         if not text or len(text) < 100:
             return False, "", "HTML file contains insufficient text content"
@@ -153,13 +259,13 @@ def parse_file(file_bytes: bytes, filename: str, max_mb: int = 5) -> Tuple[bool,
         return False, "", error_msg
     
     # Determine file type from extension
-    filename_lower = filename.lower()
+    file_type = _detect_file_type(filename)
     
-    if filename_lower.endswith('.pdf'):
+    if file_type == 'pdf':
         return parse_pdf(file_bytes)
-    elif filename_lower.endswith(('.html', '.htm')):
+    elif file_type == 'html':
         return parse_html(file_bytes)
-    elif filename_lower.endswith(('.txt', '.md', '.markdown')):
+    elif file_type == 'text':
         return parse_text(file_bytes)
     else:
         return False, "", f"Unsupported file type. Supported formats: PDF, HTML, TXT, MD"
@@ -181,13 +287,7 @@ def get_file_info(file_bytes: bytes, filename: str) -> dict:
     size_mb = size_kb / 1024
     
     # Determine file type
-    file_type = "Unknown"
-    if filename.lower().endswith('.pdf'):
-        file_type = "PDF"
-    elif filename.lower().endswith(('.html', '.htm')):
-        file_type = "HTML"
-    elif filename.lower().endswith(('.txt', '.md', '.markdown')):
-        file_type = "Text/Markdown"
+    file_type = _FILE_TYPE_LABELS.get(_detect_file_type(filename), "Unknown")
     
     return {
         "filename": filename,
@@ -1,7 +1,42 @@
 """Text cleaning and preprocessing utilities."""
 
 import re
-from typing import Optional
+from typing import Optional, Tuple
+
+
+# Runs of 3+ newlines, collapsed to a single blank line. Spelled with a
+# literal prefix rather than \n{3,} so the regex engine can jump between
+# candidate matches with a fast substring search
+_EXCESS_NEWLINES_RE = re.compile(r'\n\n\n+')
+
+# Runs of 2+ spaces (literal prefix for the same reason)
+_MULTI_SPACE_RE = re.compile(r'  +')
+
+# Common navigation patterns to remove from extracted HTML text, each with a
+# lowercase literal that every match must contain
+_NAVIGATION_RES = [
+    (re.compile(pattern, re.IGNORECASE), keyword)
+    for pattern, keyword in (
+        (r'Skip to (main )?content', 'skip to '),
+        (r'Table of [Cc]ontents?', 'table of content'),
+        (r'Navigation', 'navigation'),
+        (r'Menu', 'menu'),
+        (r'Copyright ©.*', 'copyright ©'),
+        (r'All rights reserved', 'all rights reserved'),
+        (r'Privacy Policy', 'privacy policy'),
+        (r'Terms of Service', 'terms of service'),
+        (r'Cookie Policy', 'cookie policy'),
+    )
+]
+
+# Markdown code blocks with triple backticks (contents captured)
+_CODE_BLOCK_RE = re.compile(r'```[\w]*\n(.*?)```', re.DOTALL)
+
+# Inline code spans
+_INLINE_CODE_RE = re.compile(r'`[^`]+`')
+
+# Characters per slice when counting words, bounding the split() list size
+_WORD_COUNT_CHUNK = 1 << 20
 
 
 def clean_text(text: str) -> str:
@@ -21,7 +56,7 @@ def clean_text(text: str) -> str:
     text = normalize_whitespace(text)
     
     # Remove excessive newlines (more than 2 consecutive)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _EXCESS_NEWLINES_RE.sub('\n\n', text)
     
     # Remove leading/trailing whitespace
     text = text.strip()
@@ -43,7 +78,7 @@ def normalize_whitespace(text: str) -> str:
     text = text.replace('\t', ' ')
     
     # Replace multiple spaces with single space
-    text = re.sub(r' {2,}', ' ', text)
+    text = _MULTI_SPACE_RE.sub(' ', text)
     
     # Remove spaces at the beginning and end of lines
     lines = [line.strip() for line in text.split('\n')]
@@ -62,21 +97,20 @@ def remove_navigation_elements(html_text: str) -> str:
     Returns:
         Cleaned text
     """
-    # Common navigation patterns to remove
-    patterns = [
-        r'Skip to (main )?content',
-        r'Table of [Cc]ontents?',
-        r'Navigation',
-        r'Menu',
-        r'Copyright ©.*',
-        r'All rights reserved',
-        r'Privacy Policy',
-        r'Terms of Service',
-        r'Cookie Policy',
-    ]
-    
-    for pattern in patterns:
-        html_text = re.sub(pattern, '', html_text, flags=re.IGNORECASE)
+    # For ASCII text, a case-insensitive match implies the lowercase keyword
+    # is in the lowercased text, so patterns that cannot match are skipped
+    # with a substring check instead of a full regex scan
+    lowered = html_text.lower() if html_text.isascii() else None
+    
+    for pattern, keyword in _NAVIGATION_RES:
+        if lowered is not None and keyword not in lowered:
+            continue
+        
+        cleaned = pattern.sub('', html_text)
+        if lowered is not None and len(cleaned) != len(html_text):
+            # Removals can join text into new matches for later patterns
+            lowered = cleaned.lower()
+        html_text = cleaned
     
     return html_text
 
@@ -97,15 +131,12 @@ def truncate_if_needed(text: str, max_tokens: int = 50000) -> Tuple[str, bool]:
     if len(text) <= max_chars:
         return text, False
     
-    # Truncate and add notice
-    truncated = text[:max_chars]
+    # Try to truncate at a sentence boundary in the last 10%, searching the
+    # original text in place rather than a copy of the first max_chars
+    last_period = text.rfind('.', int(max_chars * 0.9) + 1, max_chars)
+    end = last_period + 1 if last_period != -1 else max_chars
     
-    # Try to truncate at a sentence boundary
-    last_period = truncated.rfind('.')
-    if last_period > max_chars * 0.9:  # If we can find a period in the last 10%
-        truncated = truncated[:last_period + 1]
-    
-    return truncated, True
+    return text[:end], True
 
 
 def extract_code_blocks(text: str) -> list:
@@ -119,9 +150,7 @@ def extract_code_blocks(text: str) -> list:
         List of code block contents
     """
     # Match code blocks with triple backticks
-    pattern = r'```[\w]*\n(.*?)```'
-    matches = re.findall(pattern, text, re.DOTALL)
-    return matches
+    return _CODE_BLOCK_RE.findall(text)
 
 
 def remove_code_blocks(text: str) -> str:
@@ -135,10 +164,10 @@ def remove_code_blocks(text: str) -> str:
         Text with code blocks removed
     """
     # Remove code blocks with triple backticks
-    text = re.sub(r'```[\w]*\n.*?```', '[CODE BLOCK REMOVED]', text, flags=re.DOTALL)
+    text = _CODE_BLOCK_RE.sub('[CODE BLOCK REMOVED]', text)
     
     # Remove inline code
-    text = re.sub(r'`[^`]+`', '[CODE]', text)
+    text = _INLINE_CODE_RE.sub('[CODE]', text)
     
     return text
 
@@ -165,6 +194,32 @@ def sanitize_for_llm(text: str) -> str:
     return text
 
 
+def _count_words(text: str) -> int:
+    """
+    Count whitespace-separated words, matching len(text.split()).
+    
+    Splits one fixed-size slice at a time so peak memory is bounded by the
+    chunk size rather than by one string object per word in the document.
+    
+    Args:
+        text: Text to count words in
+        
+    Returns:
+        Number of words
+    """
+    if len(text) <= _WORD_COUNT_CHUNK:
+        return len(text.split())
+    
+    count = 0
+    for start in range(0, len(text), _WORD_COUNT_CHUNK):
+        count += len(text[start:start + _WORD_COUNT_CHUNK].split())
+        # A word straddling the slice boundary was counted in both slices
+        if start and not text[start].isspace() and not text[start - 1].isspace():
+            count -= 1
+    
+    return count
+
+
 def get_text_statistics(text: str) -> dict:
     """
     Get statistics about the text.
@@ -176,8 +231,9 @@ def get_text_statistics(text: str) -> dict:
         Dictionary with text statistics
     """
     char_count = len(text)
-    word_count = len(text.split())
-    line_count = len(text.splitlines())
+    word_count = _count_words(text)
+    # Count newlines rather than materializing a list with splitlines()
+    line_count = text.count('\n') + (1 if text and not text.endswith('\n') else 0)
     estimated_tokens = char_count // 4
     
     return {
@@ -187,7 +243,3 @@ def get_text_statistics(text: str) -> dict:
         "estimated_tokens": estimated_tokens,
         "estimated_cost_gpt4": round(estimated_tokens * 0.00003, 4),  # Rough estimate
     }
-
-
-# Fix import
-from typing import Tuple
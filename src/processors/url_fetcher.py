@@ -1,12 +1,57 @@
 """URL fetching and content extraction."""
 
+import threading
 import requests
-from typing import Tuple
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Tuple
 from bs4 import BeautifulSoup
+from cachetools import TTLCache
 import trafilatura
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 
+# Shared adapter, whose thread-safe connection pool lets repeated fetches
+# reuse TCP connections and TLS sessions
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+
+# Per-thread sessions, since requests.Session (and its cookie jar) isn't
+# guaranteed to be thread-safe and fetch_urls fetches from worker threads
+_THREAD_LOCAL = threading.local()
+
+# Maximum size of a fetched page, read in chunks of _CHUNK_SIZE bytes
+MAX_RESPONSE_MB = 10
+_MAX_RESPONSE_BYTES = MAX_RESPONSE_MB * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+# Successful fetches keyed on (url, timeout), so Streamlit reruns don't refetch.
+# The cache is shared by every session, so it is bounded by the total length
+# of the cached pages (at most four maximum-size pages) rather than by count
+_FETCH_CACHE = TTLCache(
+    maxsize=4 * _MAX_RESPONSE_BYTES,
+    ttl=300,
+    getsizeof=lambda result: len(result[1]),
+)
+_FETCH_CACHE_LOCK = threading.Lock()
+
+# URL schemes accepted by validate_url
+_ALLOWED_SCHEMES = frozenset({'http', 'https'})
+
+
+def _get_session() -> requests.Session:
+    """Get this thread's session, creating it on first use."""
+    session = getattr(_THREAD_LOCAL, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update({'User-Agent': 'Mozilla/5.0 (API SDK Generator Bot)'})
+        session.mount('http://', _ADAPTER)
+        session.mount('https://', _ADAPTER)
+        _THREAD_LOCAL.session = session
+    return session
+
+
+@lru_cache(maxsize=512)
 def validate_url(url: str) -> Tuple[bool, str]:
     """
     Validate URL format.
@@ -18,10 +63,10 @@ def validate_url(url: str) -> Tuple[bool, str]:
         Tuple of (is_valid, error_message)
     """
     try:
-        result = urlparse(url)
+        result = urlsplit(url)
         if not all([result.scheme, result.netloc]):
             return False, "Invalid URL format. Must include scheme (http/https) and domain."
-        if result.scheme not in ['http', 'https']:
+        if result.scheme not in _ALLOWED_SCHEMES:
             return False, "URL must use HTTP or HTTPS protocol."
         return True, ""
     except Exception as e:
@@ -39,36 +84,93 @@ def fetch_url(url: str, timeout: int = 5) -> Tuple[bool, str, str]:
     Returns:
         Tuple of (success, content_or_error, status_message)
     """
+    key = (url, timeout)
+    with _FETCH_CACHE_LOCK:
+        cached = _FETCH_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    result = _fetch_url_uncached(url, timeout)
+    
+    # Only cache successes so transient errors can be retried straight away
+    if result[0]:
+        with _FETCH_CACHE_LOCK:
+            _FETCH_CACHE[key] = result
+    return result
+
+
+def fetch_urls(
+    urls: List[str],
+    timeout: int = 5,
+    max_workers: int = 8
+) -> List[Tuple[bool, str, str]]:
+    """
+    Fetch content from several URLs concurrently.
+    
+    Args:
+        urls: URLs to fetch
+        timeout: Request timeout in seconds (per URL)
+        max_workers: Maximum number of concurrent requests
+        
+    Returns:
+        List of (success, content_or_error, status_message) tuples,
+        in the same order as urls
+    """
+    if not urls:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(lambda url: fetch_url(url, timeout), urls))
+
+
+def _fetch_url_uncached(url: str, timeout: int) -> Tuple[bool, str, str]:
+    """Fetch content from a URL, bypassing the response cache."""
     # Validate URL first
     is_valid, error_msg = validate_url(url)
     if not is_valid:
         return False, "", error_msg
     
     try:
-        # Make request with redirects
-        response = requests.get(
+        # Make request with redirects, streaming the body so it can be capped
+        with _get_session().get(
             url,
             timeout=timeout,
             allow_redirects=True,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (API SDK Generator Bot)'
-            }
-        )
-        
-        # Check status code
-        if response.status_code == 404:
-            return False, "", "Page not found (404)"
-        elif response.status_code == 403:
-            return False, "", "Access forbidden (403). Try uploading the documentation as a file instead."
-        elif response.status_code >= 400:
-            return False, "", f"HTTP error {response.status_code}"
-        
-        # Check content type
-        content_type = response.headers.get('Content-Type', '')
-        if 'text/html' not in content_type and 'text/plain' not in content_type:
-            return False, "", f"Unsupported content type: {content_type}. Expected HTML or text."
+            stream=True,
+        ) as response:
+            # Check status code
+            if response.status_code == 404:
+                return False, "", "Page not found (404)"
+            elif response.status_code == 403:
+                return False, "", "Access forbidden (403). Try uploading the documentation as a file instead."
+            elif response.status_code >= 400:
+                return False, "", f"HTTP error {response.status_code}"
+            
+            # Check content type
+            content_type = response.headers.get('Content-Type', '')
+            if 'text/html' not in content_type and 'text/plain' not in content_type:
+                return False, "", f"Unsupported content type: {content_type}. Expected HTML or text."
+            
+            # Read the body in chunks, aborting as soon as it gets too large
+            too_large = (
+                False, "",
+                f"Page is larger than {MAX_RESPONSE_MB} MB. Try uploading the documentation as a file instead."
+            )
+            content_length = response.headers.get('Content-Length', '')
+            if content_length.isdigit() and int(content_length) > _MAX_RESPONSE_BYTES:
+                return too_large
+            
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(_CHUNK_SIZE):
+                total += len(chunk)
+                if total > _MAX_RESPONSE_BYTES:
+                    return too_large
+                chunks.append(chunk)
+            
+            text = b''.join(chunks).decode(response.encoding or 'utf-8', errors='replace')
         
-        return True, response.text, f"Successfully fetched {len(response.text)} characters"
+        return True, text, f"Successfully fetched {len(text)} characters"
         
     except requests.exceptions.Timeout:
         return False, "", f"Request timed out after {timeout} seconds"
@@ -132,9 +234,8 @@ def get_preview(text: str, max_chars: int = 500) -> str:
     return text[:max_chars] + "..."
 
 
-def get_character_count(text: str) -> int:
-    """Get character count of text."""
-    return len(text)
+# Get character count of text (an alias avoids a wrapper call per use)
+get_character_count = len
 
 
 def estimate_token_count(text: str) -> int:
@@ -0,0 +1,50 @@
+"""Shared Streamlit UI helpers."""
+
+import html
+import streamlit as st
+from typing import List, Optional, Tuple
+
+
+# Extra value styles for metric grid cells with a status, using the text
+# colors of st.success and st.warning
+_STATUS_STYLES = {
+    "success": ";color:rgb(23,114,51)",
+    "warning": ";color:rgb(146,108,5)",
+}
+
+
+def use_html_metrics() -> bool:
+    """
+    Check whether metric rows should render as a single HTML grid.
+
+    Set st.session_state["_use_html_metrics"] to False to fall back to
+    st.columns + st.metric.
+    """
+    return st.session_state.setdefault("_use_html_metrics", True)
+
+
+def _metric_cell(label: str, value, status: Optional[str] = None) -> str:
+    """Build the HTML for one metric grid cell."""
+    return (
+        '<div>'
+        f'<div style="font-size:0.875rem;opacity:0.7">{html.escape(label)}</div>'
+        f'<div style="font-size:1.75rem{_STATUS_STYLES.get(status, "")}">{html.escape(str(value))}</div>'
+        '</div>'
+    )
+
+
+def render_metric_grid(metrics: List[Tuple[str, ...]]) -> None:
+    """
+    Render a row of metrics as one HTML grid element.
+
+    Args:
+        metrics: List of (label, value) or (label, value, status) tuples, one
+            per grid column. status ("success" or "warning") colors the value
+            like the matching st.success / st.warning alert
+    """
+    cells = "".join(_metric_cell(*metric) for metric in metrics)
+    st.markdown(
+        f'<div style="display:grid;grid-template-columns:repeat({len(metrics)},1fr);'
+        f'gap:1rem;margin-bottom:1rem">{cells}</div>',
+        unsafe_allow_html=True
+    )
@@ -1,99 +1,116 @@
 """Streamlit UI components for Step 1.5: Documentation Analysis."""
 
 import streamlit as st
-from typing import Tuple
 from ..models.documentation_analysis import DocumentationAnalysis
+from .components import use_html_metrics, render_metric_grid
 
 
-def render_documentation_analysis(
-    analysis: DocumentationAnalysis
-) -> Tuple[bool, str]:
+# Icon, label and badge type per document type
+_DOC_TYPE_BADGES = {
+    "api_reference": ("🟢", "API Reference", "success"),
+    "guide": ("🔵", "Guide/Tutorial", "info"),
+    "setup_instructions": ("🟡", "Setup Instructions", "warning"),
+    "mixed": ("🟣", "Mixed Content", "info"),
+}
+
+# Color code by HTTP method
+_METHOD_COLORS = {
+    "GET": "🟢",
+    "POST": "🔵",
+    "PUT": "🟡",
+    "DELETE": "🔴",
+    "PATCH": "🟣",
+}
+
+
+def _request_action(action: str) -> None:
+    """Record the chosen analysis action and rerun the full app to act on it."""
+    st.session_state["analysis_action"] = action
+    st.rerun(scope="app")
+
+
+@st.fragment
+def render_documentation_analysis(analysis: DocumentationAnalysis) -> None:
     """
     Render documentation analysis results.
     
+    Runs as a fragment, so the chosen action ("continue" | "add_more" |
+    "retry") is stored in st.session_state["analysis_action"] rather than
+    returned.
+    
     Args:
         analysis: DocumentationAnalysis object with results
-        
-    Returns:
-        Tuple of (should_proceed, action: "continue" | "add_more" | "retry")
     """
-    st.markdown("## 📊 Documentation Analysis")
-    st.markdown("---")
+    st.markdown("## 📊 Documentation Analysis\n\n---")
     
     # Document type badge
-    doc_type_badges = {
-        "api_reference": ("🟢", "API Reference", "success"),
-        "guide": ("🔵", "Guide/Tutorial", "info"),
-        "setup_instructions": ("🟡", "Setup Instructions", "warning"),
-        "mixed": ("🟣", "Mixed Content", "info")
-    }
-    
-    icon, label, badge_type = doc_type_badges.get(
+    icon, label, badge_type = _DOC_TYPE_BADGES.get(
         analysis.document_type,
         ("⚪", "Unknown", "info")
     )
     
-    st.markdown(f"### {icon} Document Type: {label}")
-    
-    # Findings section
-    st.markdown("---")
-    st.markdown("### 📋 Findings")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Endpoints Found", analysis.endpoints_found["count"])
-    
-    with col2:
-        if analysis.is_complete_api:
-            st.success("✅ Complete API")
-        else:
-            st.warning("⚠️ Partial Documentation")
-    
-    with col3:
-        if analysis.api_name:
-            st.info(f"🔍 {analysis.api_name}")
-        else:
-            st.info("🔍 API Name Unknown")
+    # Findings section (separators are folded into the adjacent markdown
+    # rather than emitted as elements of their own)
+    st.markdown(f"### {icon} Document Type: {label}\n\n---\n\n### 📋 Findings")
+    
+    if use_html_metrics():
+        render_metric_grid([
+            ("Endpoints Found", analysis.endpoints_found["count"]),
+            ("Coverage", "✅ Complete API", "success") if analysis.is_complete_api
+            else ("Coverage", "⚠️ Partial Documentation", "warning"),
+            ("API Name", f"🔍 {analysis.api_name}" if analysis.api_name else "🔍 API Name Unknown"),
+        ])
+    else:
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Endpoints Found", analysis.endpoints_found["count"])
+        
+        with col2:
+            if analysis.is_complete_api:
+                st.success("✅ Complete API")
+            else:
+                st.warning("⚠️ Partial Documentation")
+        
+        with col3:
+            if analysis.api_name:
+                st.info(f"🔍 {analysis.api_name}")
+            else:
+                st.info("🔍 API Name Unknown")
     
     if analysis.base_url:
         st.markdown(f"**Base URL:** `{analysis.base_url}`")
     
     # Endpoints list
     if analysis.endpoints_found["count"] > 0:
-        st.markdown("---")
-        st.markdown("### 📍 Endpoints Extracted")
+        st.markdown("---\n\n### 📍 Endpoints Extracted")
         
         endpoints_list = analysis.endpoints_found.get("list", [])
         if endpoints_list:
-            for ep in endpoints_list:
-                method = ep.get("method", "GET")
-                path = ep.get("path", "/unknown")
-                desc = ep.get("description", "No description")
-                
-                # Color code by method
-                method_colors = {
-                    "GET": "🟢",
-                    "POST": "🔵",
-                    "PUT": "🟡",
-                    "DELETE": "🔴",
-                    "PATCH": "🟣"
-                }
-                icon = method_colors.get(method, "⚪")
-                
-                st.markdown(f"{icon} **{method}** `{path}` - {desc}")
+            # One virtualized table renders in constant time regardless of size
+            st.dataframe(
+                [
+                    {
+                        "Method": f"{_METHOD_COLORS.get(ep.get('method', 'GET'), '⚪')} {ep.get('method', 'GET')}",
+                        "Path": ep.get("path", "/unknown"),
+                        "Description": ep.get("description", "No description"),
+                    }
+                    for ep in endpoints_list
+                ],
+                hide_index=True
+            )
         else:
             st.caption(f"{analysis.endpoints_found['count']} endpoint(s) found")
     
     # Additional endpoints available
     if analysis.navigation_detected.has_more_endpoints:
-        st.markdown("---")
-        st.markdown("### 📚 Additional Endpoints Available")
+        st.markdown("---\n\n### 📚 Additional Endpoints Available")
         
         if analysis.navigation_detected.other_sections:
             st.markdown("The documentation site contains these other API sections:")
-            for section in analysis.navigation_detected.other_sections:
-                st.markdown(f"• {section}")
+            st.markdown("\n\n".join(
+                f"• {section}" for section in analysis.navigation_detected.other_sections
+            ))
         
         if analysis.navigation_detected.reference_urls:
             st.markdown("**Suggested URLs:**")
@@ -101,18 +118,19 @@ def render_documentation_analysis(
                 st.code(url, language="text")
     
     # User message
-    st.markdown("---")
-    st.markdown("### 💡 Analysis Summary")
+    st.markdown("---\n\n### 💡 Analysis Summary")
     st.info(analysis.user_message)
     
-    # Recommendations
+    # Recommendations, followed by the separator above the action buttons
     if analysis.recommendations:
-        st.markdown("### 🎯 Recommendations")
-        for idx, rec in enumerate(analysis.recommendations, 1):
-            st.markdown(f"{idx}. {rec}")
+        recommendations = "\n".join(
+            f"{idx}. {rec}" for idx, rec in enumerate(analysis.recommendations, 1)
+        )
+        st.markdown(f"### 🎯 Recommendations\n\n{recommendations}\n\n---")
+    else:
+        st.markdown("---")
     
     # Action buttons
-    st.markdown("---")
     
     # Determine button layout based on endpoint count
     if analysis.endpoints_found["count"] == 0:
@@ -121,13 +139,11 @@ def render_documentation_analysis(
         
         with col1:
             if st.button("🔄 Try Suggested URLs", type="primary", use_container_width=True):
-                return True, "retry"
+                _request_action("retry")
         
         with col2:
             if st.button("⬅️ Provide Different URLs", use_container_width=True):
-                return True, "add_more"
-        
-        return False, "none"
+                _request_action("add_more")
     
     elif analysis.endpoints_found["count"] <= 3 and not analysis.is_complete_api:
         # Partial documentation - allow continue or add more
@@ -135,13 +151,11 @@ def render_documentation_analysis(
         
         with col1:
             if st.button("✅ Continue with These", type="primary", use_container_width=True):
-                return True, "continue"
+                _request_action("continue")
         
         with col2:
             if st.button("➕ Add More URLs", use_container_width=True):
-                return True, "add_more"
-        
-        return False, "none"
+                _request_action("add_more")
     
     else:
         # Good documentation - proceed
@@ -149,13 +163,11 @@ def render_documentation_analysis(
         
         with col1:
             if st.button("➡️ Continue to Extraction", type="primary", use_container_width=True):
-                return True, "continue"
+                _request_action("continue")
         
         with col2:
             if st.button("➕ Add More URLs", use_container_width=True):
-                return True, "add_more"
-        
-        return False, "none"
+                _request_action("add_more")
 
 
 def render_analysis_error(error_message: str):
@@ -1,22 +1,160 @@
 """Streamlit UI components for Step 1: Input Selection."""
 
+import hashlib
+import io
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from pathlib import Path
 import streamlit as st
 from typing import Tuple, Optional
 from ..processors import (
-    fetch_url,
+    fetch_urls,
     extract_text_from_html,
     parse_file,
     get_text_statistics,
     sanitize_for_llm,
 )
+from .components import use_html_metrics, render_metric_grid
 
 
-def render_step1_input_selection() -> Tuple[bool, str, str]:
+# Upper bound on uploaded files parsed concurrently
+_MAX_PARSE_WORKERS = 8
+
+
+# Cached helpers here and in the other steps are keyed on a digest of their
+# input; the input itself is passed as an underscore-prefixed argument, which
+# Streamlit leaves out of its argument hashing. The caches are shared by
+# every session, so those keyed on user input also have a max_entries bound
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _extract_and_clean(content_hash: str, _html: str) -> str:
+    """
+    Extract and sanitize text from fetched HTML (cached across reruns).
+    
+    Fetching itself is cached by fetch_url, which skips failed requests.
+    """
+    return sanitize_for_llm(extract_text_from_html(_html))
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _parse_and_clean(file_hash: str, filename: str, _file_bytes: bytes) -> Tuple[bool, str, str]:
+    """
+    Parse and sanitize an uploaded file (cached across reruns).
+    
+    Returns:
+        Tuple of (success, cleaned_text, status_message)
+    """
+    success, text, message = parse_file(_file_bytes, filename)
+    return success, sanitize_for_llm(text) if success else "", message
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_example(path: str, mtime: float) -> Tuple[bool, str, str]:
+    """
+    Load and sanitize an example documentation file (cached across reruns).
+    
+    The file is memory-mapped and decoded straight from the mapping, so the
+    raw bytes are never copied into a separate buffer first.
+    
+    Args:
+        path: Path to the example file
+        mtime: File modification time, so edited examples are reloaded
+    
+    Returns:
+        Tuple of (success, cleaned_text, error_message)
+    """
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                documentation_text = ""
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    documentation_text = str(mm, 'utf-8')
+    except FileNotFoundError:
+        return False, "", f"Example file not found: {path}"
+    
+    return True, sanitize_for_llm(documentation_text), ""
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _cached_stats(text_hash: str, _text: str) -> dict:
+    """Get text statistics (cached across reruns)."""
+    return get_text_statistics(_text)
+
+
+@lru_cache(maxsize=1)
+def _get_examples() -> dict:
+    """Get the example gallery entries (resolved once per process)."""
+    # Get the project root directory
+    examples_dir = Path(__file__).parent.parent.parent / "examples"
+    
+    return {
+        "Stripe Payments API": {
+            "description": "Payment processing API with charges, customers, and subscriptions",
+            "file": examples_dir / "stripe" / "stripe_api_docs.md"
+        },
+        "GitHub REST API": {
+            "description": "Repository management, issues, pull requests, and more",
+            "file": examples_dir / "github" / "github_api_docs.md"
+        },
+        "Twilio Messaging API": {
+            "description": "SMS and messaging API for sending and receiving messages",
+            "file": examples_dir / "twilio" / "twilio_api_docs.md"
+        }
+    }
+
+
+@lru_cache(maxsize=1)
+def _example_keys() -> Tuple[str, ...]:
+    """Get the example gallery names for the selectbox (computed once per process)."""
+    return tuple(_get_examples())
+
+
+def _content_hash(content: bytes) -> str:
+    """Get a short digest of file or page contents for use as a cache key."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _preview(text: str, limit: int = 500) -> str:
+    """Get the leading part of a document for the preview expander."""
+    return text[:limit] + ("..." if len(text) > limit else "")
+
+
+def _store_result(text: str, source: str) -> bool:
+    """
+    Store newly ingested documentation in st.session_state["step1_result"].
+    
+    The result is a dict with "text", "source" and "hash" (a digest of the
+    text) keys. Re-storing an unchanged result skips re-hashing the text.
+    
+    Args:
+        text: Cleaned documentation text
+        source: Human-readable input source
+        
+    Returns:
+        True, so input renderers can return the call directly
+    """
+    current = st.session_state.get('step1_result')
+    if current is None or current['source'] != source or current['text'] != text:
+        st.session_state['step1_result'] = {
+            'text': text,
+            'source': source,
+            'hash': _content_hash(text.encode('utf-8')),
+        }
+    return True
+
+
+def render_step1_input_selection() -> bool:
     """
     Render Step 1: Input Selection UI.
     
+    New input is stored in st.session_state["step1_result"] (see
+    _store_result) rather than returned.
+    
     Returns:
-        Tuple of (has_input, documentation_text, input_source)
+        True if input was provided on this run
     """
     st.markdown("## 📄 Step 1: Provide API Documentation")
     st.markdown("Choose how you'd like to provide the API documentation:")
@@ -29,27 +167,23 @@ def render_step1_input_selection() -> Tuple[bool, str, str]:
         label_visibility="collapsed"
     )
     
-    documentation_text = ""
-    input_source = ""
-    has_input = False
-    
     if input_method == "🔗 URL":
-        has_input, documentation_text, input_source = render_url_input()
+        has_input = render_url_input()
     elif input_method == "📁 File Upload":
-        has_input, documentation_text, input_source = render_file_upload()
+        has_input = render_file_upload()
     elif input_method == "✍️ Text Paste":
-        has_input, documentation_text, input_source = render_text_paste()
+        has_input = render_text_paste()
     else:  # Example Gallery
-        has_input, documentation_text, input_source = render_example_gallery()
+        has_input = render_example_gallery()
     
     # Show statistics if we have input
-    if has_input and documentation_text:
-        render_input_statistics(documentation_text)
+    if has_input and st.session_state['step1_result']['text']:
+        render_input_statistics()
     
-    return has_input, documentation_text, input_source
+    return has_input
 
 
-def render_url_input() -> Tuple[bool, str, str]:
+def render_url_input() -> bool:
     """Render URL input section."""
     st.markdown("### 🔗 Fetch from URLs")
     st.markdown("Enter one or more URLs to fetch API documentation from multiple pages:")
@@ -72,58 +206,46 @@ def render_url_input() -> Tuple[bool, str, str]:
         
         if not urls:
             st.warning("⚠️ Please enter at least one URL")
-            return False, "", ""
+            return False
         
-        all_texts = []
         successful_urls = []
         
-        # Fetch all URLs
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+        # Fetch all URLs concurrently
+        with st.spinner(f"Fetching {len(urls)} URL(s)..."):
+            results = fetch_urls(urls, timeout=10)
         
-        for idx, url in enumerate(urls):
-            status_text.text(f"Fetching {idx + 1}/{len(urls)}: {url}")
-            progress_bar.progress((idx + 1) / len(urls))
-            
-            success, content, message = fetch_url(url, timeout=10)
-            
+        # Combine all documents into one buffer, with clear separators
+        buf = io.StringIO()
+        for url, (success, content, message) in zip(urls, results):
             if success:
-                text = extract_text_from_html(content)
-                all_texts.append(text)
+                text = _extract_and_clean(_content_hash(content.encode('utf-8')), content)
+                buf.write(f"\n\n{'=' * 80}\n=== URL: {url} ===\n\n")
+                buf.write(text)
                 successful_urls.append(url)
                 st.success(f"✅ {url}: {message}")
             else:
                 st.error(f"❌ {url}: {message}")
         
-        progress_bar.empty()
-        status_text.empty()
-        
-        if all_texts:
-            # Combine all documents with clear separators
-            combined_text = "\n\n" + "="*80 + "\n\n".join([
-                f"=== URL: {url} ===\n\n{text}" 
-                for url, text in zip(successful_urls, all_texts)
-            ])
-            
-            cleaned_text = sanitize_for_llm(combined_text)
+        if successful_urls:
+            cleaned_text = buf.getvalue().strip()
             
             # Show summary
-            st.info(f"📚 **Successfully fetched {len(all_texts)} page(s) out of {len(urls)}**")
+            st.info(f"📚 **Successfully fetched {len(successful_urls)} page(s) out of {len(urls)}**")
             
             # Show preview
             with st.expander("📖 Preview (first 500 characters of combined text)"):
-                st.text(cleaned_text[:500] + "...")
+                st.text(_preview(cleaned_text))
             
             url_list = ", ".join([url.split('//')[-1].split('/')[0] for url in successful_urls])
-            return True, cleaned_text, f"URLs: {url_list}"
+            return _store_result(cleaned_text, f"URLs: {url_list}")
         else:
             st.error("❌ Failed to fetch any URLs")
-            return False, "", ""
+            return False
     
-    return False, "", ""
+    return False
 
 
-def render_file_upload() -> Tuple[bool, str, str]:
+def render_file_upload() -> bool:
     """Render file upload section."""
     st.markdown("### 📁 Upload Documentation Files")
     st.markdown("Upload one or more PDF, HTML, TXT, or Markdown files:")
@@ -136,47 +258,58 @@ def render_file_upload() -> Tuple[bool, str, str]:
     )
     
     if uploaded_files:
-        all_texts = []
         file_names = []
         
-        with st.spinner(f"Processing {len(uploaded_files)} file(s)..."):
-            for uploaded_file in uploaded_files:
-                file_bytes = uploaded_file.read()
-                
-                success, text, message = parse_file(file_bytes, uploaded_file.name)
-                
+        uploads = []
+        for f in uploaded_files:
+            file_bytes = f.read()
+            uploads.append((_content_hash(file_bytes), f.name, file_bytes))
+        
+        # Files already parsed in this session are cache hits, so skip
+        # mounting a spinner for them on every rerun
+        parsed = st.session_state.setdefault('_parsed_uploads', set())
+        if all(file_hash in parsed for file_hash, _, _ in uploads):
+            spinner = nullcontext()
+        else:
+            spinner = st.spinner(f"Processing {len(uploaded_files)} file(s)...")
+        
+        with spinner:
+            # Files are independent, so parse them concurrently; all st.*
+            # calls stay on the script thread once the pool has finished
+            with ThreadPoolExecutor(max_workers=min(_MAX_PARSE_WORKERS, len(uploads))) as executor:
+                results = list(executor.map(lambda upload: _parse_and_clean(*upload), uploads))
+            parsed.update(file_hash for file_hash, _, _ in uploads)
+            
+            # Combine all documents into one buffer, with clear separators
+            buf = io.StringIO()
+            for uploaded_file, (success, text, message) in zip(uploaded_files, results):
                 if success:
-                    all_texts.append(text)
+                    buf.write(f"\n\n{'=' * 80}\n=== Document: {uploaded_file.name} ===\n\n")
+                    buf.write(text)
                     file_names.append(uploaded_file.name)
                     st.success(f"✅ {uploaded_file.name}: {message}")
                 else:
                     st.error(f"❌ {uploaded_file.name}: {message}")
         
-        if all_texts:
-            # Combine all documents with clear separators
-            combined_text = "\n\n" + "="*80 + "\n\n".join([
-                f"=== Document: {name} ===\n\n{text}" 
-                for name, text in zip(file_names, all_texts)
-            ])
-            
-            cleaned_text = sanitize_for_llm(combined_text)
+        if file_names:
+            cleaned_text = buf.getvalue().strip()
             
             # Show summary
-            st.info(f"📚 **Combined {len(all_texts)} document(s)**")
+            st.info(f"📚 **Combined {len(file_names)} document(s)**")
             
             # Show preview
             with st.expander("📖 Preview (first 500 characters of combined text)"):
-                st.text(cleaned_text[:500] + "...")
+                st.text(_preview(cleaned_text))
             
             file_list = ", ".join(file_names)
-            return True, cleaned_text, f"Files: {file_list}"
+            return _store_result(cleaned_text, f"Files: {file_list}")
         else:
-            return False, "", ""
+            return False
     
-    return False, "", ""
+    return False
 
 
-def render_text_paste() -> Tuple[bool, str, str]:
+def render_text_paste() -> bool:
     """Render text paste section."""
     st.markdown("### ✍️ Paste Documentation Text")
     st.markdown("Paste your API documentation directly:")
@@ -189,48 +322,33 @@ def render_text_paste() -> Tuple[bool, str, str]:
     )
     
     if text and len(text) >= 100:
-        cleaned_text = sanitize_for_llm(text)
+        # Only re-sanitize when the pasted text has actually changed
+        text_hash = hash(text)
+        if st.session_state.get('_paste_hash') != text_hash:
+            st.session_state['_paste_cleaned'] = sanitize_for_llm(text)
+            st.session_state['_paste_hash'] = text_hash
+        cleaned_text = st.session_state['_paste_cleaned']
         
         st.success(f"✅ Text received ({len(text)} characters)")
         
-        return True, cleaned_text, "Text Paste"
+        return _store_result(cleaned_text, "Text Paste")
     elif text and len(text) < 100:
         st.warning("⚠️ Please provide at least 100 characters of documentation")
-        return False, "", ""
+        return False
     
-    return False, "", ""
+    return False
 
 
-def render_example_gallery() -> Tuple[bool, str, str]:
+def render_example_gallery() -> bool:
     """Render example gallery section."""
     st.markdown("### 🎨 Example Gallery")
     st.markdown("Choose from pre-built examples to see the SDK generator in action:")
     
-    from pathlib import Path
-    
-    # Get the project root directory
-    current_file = Path(__file__)
-    project_root = current_file.parent.parent.parent
-    examples_dir = project_root / "examples"
-    
-    examples = {
-        "Stripe Payments API": {
-            "description": "Payment processing API with charges, customers, and subscriptions",
-            "file": examples_dir / "stripe" / "stripe_api_docs.md"
-        },
-        "GitHub REST API": {
-            "description": "Repository management, issues, pull requests, and more",
-            "file": examples_dir / "github" / "github_api_docs.md"
-        },
-        "Twilio Messaging API": {
-            "description": "SMS and messaging API for sending and receiving messages",
-            "file": examples_dir / "twilio" / "twilio_api_docs.md"
-        }
-    }
+    examples = _get_examples()
     
     selected_example = st.selectbox(
         "Select an example",
-        options=list(examples.keys()),
+        options=_example_keys(),
         help="Choose an example to generate an SDK"
     )
     
@@ -247,37 +365,46 @@ def render_example_gallery() -> Tuple[bool, str, str]:
             try:
                 # Load the example file
                 example_file = example['file']
+                mtime = example_file.stat().st_mtime if example_file.exists() else 0.0
+                success, cleaned_text, error = _load_example(str(example_file), mtime)
                 
-                if example_file.exists():
-                    with open(example_file, 'r', encoding='utf-8') as f:
-                        documentation_text = f.read()
-                    
-                    cleaned_text = sanitize_for_llm(documentation_text)
-                    
+                if success:
                     st.success(f"✅ Loaded {selected_example} example!")
                     
                     # Show preview
                     with st.expander("📖 Preview (first 500 characters)"):
-                        st.text(cleaned_text[:500] + "...")
+                        st.text(_preview(cleaned_text))
                     
-                    return True, cleaned_text, f"Example: {selected_example}"
+                    return _store_result(cleaned_text, f"Example: {selected_example}")
                 else:
-                    st.error(f"❌ Example file not found: {example_file}")
-                    return False, "", ""
+                    st.error(f"❌ {error}")
+                    return False
                     
             except Exception as e:
                 st.error(f"❌ Error loading example: {str(e)}")
-                return False, "", ""
+                return False
     
-    return False, "", ""
+    return False
 
 
-def render_input_statistics(text: str):
-    """Render statistics about the input."""
-    stats = get_text_statistics(text)
+@st.fragment
+def render_input_statistics():
+    """Render statistics about the input in st.session_state["step1_result"]."""
+    # The digest was computed once at ingestion, so reruns only pay for the
+    # cache lookup; the metrics themselves must still be emitted on every run
+    result = st.session_state['step1_result']
+    stats = _cached_stats(result['hash'], result['text'])
+    
+    st.markdown("---\n\n### 📊 Input Statistics")
     
-    st.markdown("---")
-    st.markdown("### 📊 Input Statistics")
+    if use_html_metrics():
+        render_metric_grid([
+            ("Characters", f"{stats['characters']:,}"),
+            ("Words", f"{stats['words']:,}"),
+            ("Est. Tokens", f"{stats['estimated_tokens']:,}"),
+            ("Est. Cost", f"${stats['estimated_cost_gpt4']}"),
+        ])
+        return
     
     col1, col2, col3, col4 = st.columns(4)
     
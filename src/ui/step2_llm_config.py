@@ -1,15 +1,115 @@
 """Streamlit UI components for Step 2: LLM Configuration."""
 
+from __future__ import annotations
+
+import hashlib
 import streamlit as st
-from typing import Tuple, Optional, Dict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    # Provider SDKs are slow to import, so they are only loaded on demand
+    from ..llm import BaseLLMProvider
+
 
+# Seconds a cached provider (and the API key it holds) is kept before it is
+# recreated
+_PROVIDER_TTL = 30 * 60
 
-def render_step2_llm_config() -> Tuple[bool, Optional, Dict]:
+
+@st.cache_resource(show_spinner=False, max_entries=16, ttl=_PROVIDER_TTL)
+def _make_provider(kind: str, api_key: str, config_items: Tuple) -> BaseLLMProvider:
     """
-    Render Step 2: LLM Configuration UI.
+    Create an LLM provider, shared across reruns and sessions.
+    
+    Providers hold no per-request state, so one instance (and its HTTP
+    client's connection pool) can be reused for the same key and config.
+    Entries expire after _PROVIDER_TTL, so users' keys aren't kept in
+    memory indefinitely once their sessions end.
+    
+    Args:
+        kind: "openai" or "gemini"
+        api_key: Provider API key
+        config_items: Sorted (key, value) pairs of the provider configuration
+        
+    Returns:
+        Provider instance
+    """
+    config = dict(config_items) or None
+    
+    if kind == "openai":
+        from ..llm import OpenAIProvider
+        return OpenAIProvider(api_key, config)
+    
+    from ..llm import GeminiProvider
+    return GeminiProvider(api_key, config)
+
+
+class _KeyValidationFailed(Exception):
+    """Raised by _cached_key_validation so failed validations aren't cached."""
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_key_validation(kind: str, key_hash: str, _provider: BaseLLMProvider) -> str:
+    """
+    Validate a provider API key, caching only successful validations.
+    
+    Returns:
+        Success message
+        
+    Raises:
+        _KeyValidationFailed: With the provider's message, if validation failed
+    """
+    is_valid, message = _provider.validate_api_key()
+    if not is_valid:
+        raise _KeyValidationFailed(message)
+    return message
+
+
+def _validate_api_key(kind: str, key_hash: str, provider: BaseLLMProvider) -> Tuple[bool, str]:
+    """
+    Validate a provider API key (cached, so re-clicking Validate is free).
     
+    Failures (invalid keys, rate limits, network errors) aren't cached, so
+    they are retried on the next click.
+    
+    Args:
+        kind: "openai" or "gemini"
+        key_hash: Digest of the API key, used as the cache key
+        provider: Provider holding the API key
+        
     Returns:
-        Tuple of (is_configured, llm_provider, config_dict)
+        Tuple of (is_valid, message)
+    """
+    try:
+        return True, _cached_key_validation(kind, key_hash, provider)
+    except _KeyValidationFailed as e:
+        return False, str(e)
+
+
+def _get_provider(is_openai: bool, api_key: str, config: Optional[Dict] = None) -> BaseLLMProvider:
+    """
+    Get an LLM provider for the API key, reusing the instance across reruns.
+    
+    Args:
+        is_openai: Whether to get an OpenAI (else Gemini) provider
+        api_key: Provider API key
+        config: Optional provider configuration
+        
+    Returns:
+        Provider instance
+    """
+    kind = "openai" if is_openai else "gemini"
+    return _make_provider(kind, api_key, tuple(sorted((config or {}).items())))
+
+
+@st.fragment
+def render_step2_llm_config() -> None:
+    """
+    Render Step 2: LLM Configuration UI.
+    
+    Runs as a fragment, so the result is stored in
+    st.session_state["llm_config"] as a dict with "is_configured",
+    "provider_instance" and "config" keys rather than returned.
     """
     st.markdown("## 🤖 Step 2: Configure LLM")
     st.markdown("Configure the AI model that will extract API specifications:")
@@ -55,14 +155,13 @@ def render_step2_llm_config() -> Tuple[bool, Optional, Dict]:
     if validate_button and api_key:
         with st.spinner(f"Validating {provider_name} API key..."):
             try:
-                if is_openai:
-                    from ..llm import OpenAIProvider
-                    provider_instance = OpenAIProvider(api_key)
-                else:
-                    from ..llm import GeminiProvider
-                    provider_instance = GeminiProvider(api_key)
+                provider_instance = _get_provider(is_openai, api_key)
                 
-                is_valid, message = provider_instance.validate_api_key()
+                is_valid, message = _validate_api_key(
+                    "openai" if is_openai else "gemini",
+                    hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest(),
+                    provider_instance
+                )
                 
                 if is_valid:
                     st.success(f"✅ {message}")
@@ -118,12 +217,7 @@ def render_step2_llm_config() -> Tuple[bool, Optional, Dict]:
     provider_instance = None
     if api_key:
         try:
-            if is_openai:
-                from ..llm import OpenAIProvider
-                provider_instance = OpenAIProvider(api_key, config)
-            else:
-                from ..llm import GeminiProvider
-                provider_instance = GeminiProvider(api_key, config)
+            provider_instance = _get_provider(is_openai, api_key, config)
             is_configured = True
         except Exception as e:
             st.error(f"Error creating provider: {str(e)}")
@@ -132,13 +226,21 @@ def render_step2_llm_config() -> Tuple[bool, Optional, Dict]:
         is_configured = False
         st.info(f"💡 Please provide your {provider_name} API key to continue")
     
-    return is_configured, provider_instance, config
+    previous = st.session_state.get("llm_config", {})
+    st.session_state["llm_config"] = {
+        "is_configured": is_configured,
+        "provider_instance": provider_instance,
+        "config": config,
+    }
+    
+    # The rest of the page depends on whether a provider is configured
+    if previous.get("is_configured", False) != is_configured:
+        st.rerun(scope="app")
 
 
-def render_cost_estimation(documentation_text: str, provider: OpenAIProvider):
+def render_cost_estimation(documentation_text: str, provider: BaseLLMProvider):
     """Render cost estimation for processing."""
-    st.markdown("---")
-    st.markdown("### 💰 Cost Estimation")
+    st.markdown("---\n\n### 💰 Cost Estimation")
     
     estimated_cost = provider.estimate_cost(documentation_text)
     
@@ -1,9 +1,57 @@
 """Streamlit UI components for Step 3: Review & Edit."""
 
 import streamlit as st
-from typing import Optional
+from typing import Dict, Optional
 from ..models import APISpecification, Endpoint
-from ..llm import calculate_api_confidence, get_confidence_level, get_confidence_color
+from ..llm import (
+    calculate_api_confidence,
+    calculate_endpoint_confidence,
+    get_confidence_level,
+    get_confidence_color,
+)
+
+
+# Selectbox options, with each option's index precomputed for lookups
+_HTTP_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH")
+_HTTP_METHOD_INDEX = {method: idx for idx, method in enumerate(_HTTP_METHODS)}
+
+_AUTH_TYPES = ("api_key", "bearer", "oauth2", "basic", "none")
+_AUTH_TYPE_INDEX = {auth_type: idx for idx, auth_type in enumerate(_AUTH_TYPES)}
+
+# Endpoint icons for confidence below 0.7, from 0.7 and from 0.9, indexed by
+# the number of thresholds the confidence reaches
+_CONFIDENCE_ICONS = ("❌", "⚠️", "✅")
+
+# Alert used to show the overall confidence level, by confidence color
+_CONFIDENCE_ALERTS = {"green": st.success, "yellow": st.warning, "red": st.error}
+
+
+def _score_spec(api_spec: APISpecification) -> Dict:
+    """
+    Score an API specification and each of its endpoints.
+    
+    The scores are kept in st.session_state["_spec_scores"] with the spec
+    they were computed for. Step 3 never modifies or replaces the stored
+    spec, so reruns showing the same spec object reuse them.
+    
+    Returns:
+        Dict with "confidence", "level", "color" and "endpoint_confidences"
+        (in endpoint order) keys
+    """
+    scores = st.session_state.get("_spec_scores")
+    
+    if scores is None or scores["spec"] is not api_spec:
+        confidence = calculate_api_confidence(api_spec)
+        scores = {
+            "spec": api_spec,
+            "confidence": confidence,
+            "level": get_confidence_level(confidence),
+            "color": get_confidence_color(confidence),
+            "endpoint_confidences": [calculate_endpoint_confidence(e) for e in api_spec.endpoints],
+        }
+        st.session_state["_spec_scores"] = scores
+    
+    return scores
 
 
 def render_step3_review_edit(api_spec: Optional[APISpecification]) -> Optional[APISpecification]:
@@ -22,10 +70,12 @@ def render_step3_review_edit(api_spec: Optional[APISpecification]) -> Optional[A
         st.info("⏳ Waiting for API specification extraction...")
         return None
     
-    # Calculate confidence score
-    confidence = calculate_api_confidence(api_spec)
-    confidence_level = get_confidence_level(confidence)
-    confidence_color = get_confidence_color(confidence)
+    # Calculate confidence scores
+    scores = _score_spec(api_spec)
+    confidence = scores["confidence"]
+    confidence_level = scores["level"]
+    confidence_color = scores["color"]
+    endpoint_confidences = scores["endpoint_confidences"]
     
     # Show overall confidence
     st.markdown("### 📊 Extraction Quality")
@@ -36,12 +86,7 @@ def render_step3_review_edit(api_spec: Optional[APISpecification]) -> Optional[A
         st.metric("Confidence Score", f"{confidence:.1%}")
     
     with col2:
-        if confidence_color == "green":
-            st.success(confidence_level)
-        elif confidence_color == "yellow":
-            st.warning(confidence_level)
-        else:
-            st.error(confidence_level)
+        _CONFIDENCE_ALERTS.get(confidence_color, st.error)(confidence_level)
     
     with col3:
         st.metric("Endpoints Found", len(api_spec.endpoints))
@@ -59,8 +104,8 @@ def render_step3_review_edit(api_spec: Optional[APISpecification]) -> Optional[A
     with col2:
         auth_type = st.selectbox(
             "Authentication Type",
-            ["api_key", "bearer", "oauth2", "basic", "none"],
-            index=["api_key", "bearer", "oauth2", "basic", "none"].index(api_spec.auth_type.value)
+            _AUTH_TYPES,
+            index=_AUTH_TYPE_INDEX[api_spec.auth_type.value]
         )
     
     # Endpoints
@@ -72,7 +117,7 @@ def render_step3_review_edit(api_spec: Optional[APISpecification]) -> Optional[A
     else:
         # Display endpoints in expandable sections
         for idx, endpoint in enumerate(api_spec.endpoints):
-            render_endpoint_editor(endpoint, idx)
+            render_endpoint_editor(endpoint, idx, endpoint_confidences[idx])
     
     # Add new endpoint button
     if st.button("➕ Add New Endpoint"):
@@ -84,85 +129,89 @@ def render_step3_review_edit(api_spec: Optional[APISpecification]) -> Optional[A
     return api_spec
 
 
-def render_endpoint_editor(endpoint: Endpoint, index: int):
+def render_endpoint_editor(endpoint: Endpoint, index: int, confidence: Optional[float] = None):
     """Render editor for a single endpoint."""
-    # Calculate endpoint confidence
-    from ..llm import calculate_endpoint_confidence
-    confidence = calculate_endpoint_confidence(endpoint)
+    # Calculate endpoint confidence unless the caller already has it
+    if confidence is None:
+        confidence = calculate_endpoint_confidence(endpoint)
     
     # Color code based on confidence
-    if confidence >= 0.9:
-        icon = "✅"
-    elif confidence >= 0.7:
-        icon = "⚠️"
-    else:
-        icon = "❌"
+    icon = _CONFIDENCE_ICONS[(confidence >= 0.7) + (confidence >= 0.9)]
     
     with st.expander(f"{icon} {endpoint.method.value} {endpoint.path} ({confidence:.0%})"):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.text_input(f"Path #{index}", value=endpoint.path, key=f"path_{index}")
-            st.selectbox(
-                f"Method #{index}",
-                ["GET", "POST", "PUT", "DELETE", "PATCH"],
-                index=["GET", "POST", "PUT", "DELETE", "PATCH"].index(endpoint.method.value),
-                key=f"method_{index}"
-            )
-        
-        with col2:
-            st.text_area(
-                f"Description #{index}",
-                value=endpoint.description,
-                height=100,
-                key=f"desc_{index}"
-            )
-        
-        # Parameters
-        if endpoint.parameters:
-            st.markdown("**Parameters:**")
-            for param_idx, param in enumerate(endpoint.parameters):
-                st.text(f"• {param.name} ({param.type.value}, {param.location.value})" + 
-                       (" - required" if param.required else " - optional"))
-        else:
-            st.caption("No parameters")
-        
-        # Response schema
-        if endpoint.response_schema:
-            st.markdown("**Response Type:**")
-            st.code(endpoint.response_schema.type.value, language="text")
+        _render_endpoint_fields(endpoint, index)
+
+
+@st.fragment
+def _render_endpoint_fields(endpoint: Endpoint, index: int):
+    """
+    Render the editable fields for a single endpoint.
+    
+    Runs as a fragment, so editing one endpoint's fields reruns only that
+    endpoint rather than the whole review page.
+    """
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.text_input(f"Path #{index}", value=endpoint.path, key=f"path_{index}")
+        st.selectbox(
+            f"Method #{index}",
+            _HTTP_METHODS,
+            index=_HTTP_METHOD_INDEX[endpoint.method.value],
+            key=f"method_{index}"
+        )
+    
+    with col2:
+        st.text_area(
+            f"Description #{index}",
+            value=endpoint.description,
+            height=100,
+            key=f"desc_{index}"
+        )
+    
+    # Parameters
+    if endpoint.parameters:
+        st.markdown("**Parameters:**")
+        for param_idx, param in enumerate(endpoint.parameters):
+            st.text(f"• {param.name} ({param.type.value}, {param.location.value})" + 
+                   (" - required" if param.required else " - optional"))
+    else:
+        st.caption("No parameters")
+    
+    # Response schema
+    if endpoint.response_schema:
+        st.markdown("**Response Type:**")
+        st.code(endpoint.response_schema.type.value, language="text")
 
 
 def render_extraction_warnings(api_spec: APISpecification):
     """Render warnings about extraction quality."""
     warnings = []
     
-    # Check for low confidence endpoints
-    from ..llm import calculate_endpoint_confidence
+    endpoint_confidences = _score_spec(api_spec)["endpoint_confidences"]
     
-    low_confidence_endpoints = [
-        e for e in api_spec.endpoints
-        if calculate_endpoint_confidence(e) < 0.7
-    ]
+    # Count low confidence, short description and parameterless endpoints
+    # in a single pass
+    low_confidence = missing_desc = no_params = 0
+    for endpoint, confidence in zip(api_spec.endpoints, endpoint_confidences):
+        low_confidence += confidence < 0.7
+        missing_desc += len(endpoint.description) < 20
+        no_params += not endpoint.parameters
     
-    if low_confidence_endpoints:
+    if low_confidence:
         warnings.append(
-            f"⚠️ {len(low_confidence_endpoints)} endpoint(s) have low confidence scores. "
+            f"⚠️ {low_confidence} endpoint(s) have low confidence scores. "
             "Please review and edit them carefully."
         )
     
-    # Check for missing descriptions
-    missing_desc = [e for e in api_spec.endpoints if len(e.description) < 20]
     if missing_desc:
         warnings.append(
-            f"⚠️ {len(missing_desc)} endpoint(s) have very short descriptions."
+            f"⚠️ {missing_desc} endpoint(s) have very short descriptions."
         )
     
-    # Check for endpoints without parameters
-    no_params = [e for e in api_spec.endpoints if not e.parameters]
     if no_params:
         warnings.append(
-            f"💡 {len(no_params)} endpoint(s) have no parameters. "
+            f"💡 {no_params} endpoint(s) have no parameters. "
             "This might be correct, but please verify."
         )
     
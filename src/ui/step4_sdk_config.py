@@ -1,10 +1,27 @@
 """Streamlit UI components for Step 4: SDK Configuration."""
 
+import string
 import streamlit as st
 from typing import Optional
 from ..models import SDKConfig, RetryConfig, RateLimitConfig, License
 
 
+# Configuration preview, filled in with the current settings
+_CONFIG_SUMMARY = string.Template("""
+**Package:** `${package_name}@${version}`  
+**Author:** ${author}  
+**License:** ${license_type}  
+
+**Features:**
+- Retry Logic: ${retry}
+- Rate Limiting: ${rate_limit}
+- Error Handling: ${error_handling}
+""")
+
+# Preview label for a disabled (False) or enabled (True) feature
+_FEATURE_STATUS = ("❌ Disabled", "✅ Enabled")
+
+
 def render_step4_sdk_config() -> Optional[SDKConfig]:
     """
     Render Step 4: SDK Configuration UI.
@@ -73,93 +90,24 @@ def render_step4_sdk_config() -> Optional[SDKConfig]:
             help="Comprehensive error classes"
         )
     
-    # Retry Configuration
-    retry_config = None
-    if enable_retry:
-        with st.expander("🔄 Retry Configuration"):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                max_retries = st.slider(
-                    "Max Retries",
-                    min_value=1,
-                    max_value=10,
-                    value=3,
-                    help="Maximum number of retry attempts"
-                )
-                
-                base_delay = st.slider(
-                    "Base Delay (seconds)",
-                    min_value=0.5,
-                    max_value=5.0,
-                    value=1.0,
-                    step=0.5,
-                    help="Initial delay before first retry"
-                )
-            
-            with col2:
-                max_delay = st.slider(
-                    "Max Delay (seconds)",
-                    min_value=5.0,
-                    max_value=60.0,
-                    value=30.0,
-                    step=5.0,
-                    help="Maximum delay between retries"
-                )
-            
-            retry_config = RetryConfig(
-                max_retries=max_retries,
-                base_delay=base_delay,
-                max_delay=max_delay,
-                retryable_status_codes=[408, 429, 500, 502, 503, 504]
-            )
-    
-    # Rate Limit Configuration
-    rate_limit_config = None
-    if enable_rate_limit:
-        with st.expander("⏱️ Rate Limit Configuration"):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                requests_per_second = st.slider(
-                    "Requests per Second",
-                    min_value=1,
-                    max_value=100,
-                    value=10,
-                    help="Maximum requests per second"
-                )
-            
-            with col2:
-                burst_allowance = st.slider(
-                    "Burst Allowance",
-                    min_value=1,
-                    max_value=50,
-                    value=5,
-                    help="Number of requests that can burst"
-                )
-            
-            rate_limit_config = RateLimitConfig(
-                requests_per_second=requests_per_second,
-                burst_allowance=burst_allowance,
-                algorithm="token_bucket"
-            )
+    # Retry and rate limit settings render as fragments, so moving their
+    # sliders doesn't rerun the rest of the page
+    retry_config = _retry_fragment() if enable_retry else None
+    rate_limit_config = _rate_fragment() if enable_rate_limit else None
     
     # Configuration Preview
     st.markdown("---")
     st.markdown("### 👀 Configuration Preview")
     
-    config_summary = f"""
-**Package:** `{package_name}@{version}`  
-**Author:** {author or "Not specified"}  
-**License:** {license_type}  
-
-**Features:**
-- Retry Logic: {"✅ Enabled" if enable_retry else "❌ Disabled"}
-- Rate Limiting: {"✅ Enabled" if enable_rate_limit else "❌ Disabled"}
-- Error Handling: {"✅ Enabled" if enable_error_handling else "❌ Disabled"}
-"""
-    
-    st.markdown(config_summary)
+    st.markdown(_CONFIG_SUMMARY.substitute(
+        package_name=package_name,
+        version=version,
+        author=author or "Not specified",
+        license_type=license_type,
+        retry=_FEATURE_STATUS[enable_retry],
+        rate_limit=_FEATURE_STATUS[enable_rate_limit],
+        error_handling=_FEATURE_STATUS[enable_error_handling],
+    ))
     
     # Create SDK config
     try:
@@ -179,3 +127,87 @@ def render_step4_sdk_config() -> Optional[SDKConfig]:
     except Exception as e:
         st.error(f"❌ Configuration error: {str(e)}")
         return None
+
+
+@st.fragment
+def _retry_fragment() -> RetryConfig:
+    """
+    Render the retry configuration section.
+    
+    Runs as a fragment, so slider changes rerun only this section. The
+    returned config is used on full reruns, which happen before the SDK
+    is generated.
+    """
+    with st.expander("🔄 Retry Configuration"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            max_retries = st.slider(
+                "Max Retries",
+                min_value=1,
+                max_value=10,
+                value=3,
+                help="Maximum number of retry attempts"
+            )
+            
+            base_delay = st.slider(
+                "Base Delay (seconds)",
+                min_value=0.5,
+                max_value=5.0,
+                value=1.0,
+                step=0.5,
+                help="Initial delay before first retry"
+            )
+        
+        with col2:
+            max_delay = st.slider(
+                "Max Delay (seconds)",
+                min_value=5.0,
+                max_value=60.0,
+                value=30.0,
+                step=5.0,
+                help="Maximum delay between retries"
+            )
+        
+        return RetryConfig(
+            max_retries=max_retries,
+            base_delay=base_delay,
+            max_delay=max_delay
+        )
+
+
+@st.fragment
+def _rate_fragment() -> RateLimitConfig:
+    """
+    Render the rate limit configuration section.
+    
+    Runs as a fragment, so slider changes rerun only this section. The
+    returned config is used on full reruns, which happen before the SDK
+    is generated.
+    """
+    with st.expander("⏱️ Rate Limit Configuration"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            requests_per_second = st.slider(
+                "Requests per Second",
+                min_value=1,
+                max_value=100,
+                value=10,
+                help="Maximum requests per second"
+            )
+        
+        with col2:
+            burst_allowance = st.slider(
+                "Burst Allowance",
+                min_value=1,
+                max_value=50,
+                value=5,
+                help="Number of requests that can burst"
+            )
+        
+        return RateLimitConfig(
+            requests_per_second=requests_per_second,
+            burst_allowance=burst_allowance,
+            algorithm="token_bucket"
+        )
